@@ -3,8 +3,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import socket
-from datetime import datetime, timedelta
-from typing import Callable, Tuple, Any, cast
+import time
+from typing import AbstractSet, Callable, Tuple, Any
 import ipaddress
 
 from .device import GoveeDevice
@@ -29,9 +29,63 @@ COMMAND_PORT = 4003
 DISCOVERY_INTERVAL = 10
 EVICT_INTERVAL = DISCOVERY_INTERVAL * 3
 UPDATE_INTERVAL = 5
+RECEIVE_BUFFER_SIZE = 2 * 1024 * 1024
+SEND_BUFFER_SIZE = 512 * 1024
+STATUS_REQUEST_MIN_INTERVAL = 0.5
+
+
+class _LazyBytesHead:
+    """Defer slicing a payload until a log record is actually formatted."""
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, data: bytes, size: int) -> None:
+        self._data = data
+        self._size = size
+
+    def __str__(self) -> str:
+        return str(self._data[: self._size])
 
 
 class GoveeController:
+    __slots__ = (
+        "_transport",
+        "_protocol",
+        "_broadcast_address",
+        "_broadcast_port",
+        "_listening_address",
+        "_listening_port",
+        "_device_command_port",
+        "_receive_buffer_size",
+        "_send_buffer_size",
+        "_interface",
+        "_is_multicast",
+        "_listening_address_packed",
+        "_membership_request",
+        "_loop",
+        "_cleanup_done",
+        "_message_factory",
+        "_scan_payload",
+        "_status_payload",
+        "_devices",
+        "_devices_by_ip",
+        "_devices_by_sku",
+        "_last_status_request",
+        "_discovery_enabled",
+        "_discovery_interval",
+        "_update_enabled",
+        "_update_interval",
+        "_evict_enabled",
+        "_evict_interval",
+        "_device_discovered_callback",
+        "_device_evicted_callback",
+        "_logger",
+        "_discovery_task",
+        "_update_task",
+        "_response_handlers",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         loop=None,
@@ -49,6 +103,9 @@ class GoveeController:
         discovered_callback: Callable[[GoveeDevice, bool], bool] | None = None,
         evicted_callback: Callable[[GoveeDevice], None] | None = None,
         logger: logging.Logger | None = None,
+        receive_buffer_size: int | None = RECEIVE_BUFFER_SIZE,
+        send_buffer_size: int | None = SEND_BUFFER_SIZE,
+        interface: str | None = None,
     ) -> None:
         """Build a controller that handle Govee devices that support local API on local network.
 
@@ -66,6 +123,9 @@ class GoveeController:
             update_interval (int): Interval between a status update is requested to devices.
             discovered_callback (Callable[GoveeDevice, bool]): An optional function to call when a device is discovered (or rediscovered). Default None
             evicted_callback (Callable[GoveeDevice]): An optional function to call when a device is evicted.
+            receive_buffer_size (int): Requested size of the socket receive buffer, to absorb bursts of discovery responses. The kernel may cap it. If None the OS default is kept. Default: 2 MiB
+            send_buffer_size (int): Requested size of the socket send buffer. If None the OS default is kept. Default: 512 KiB
+            interface (str): Optional network interface name (e.g. ``eth0``) the socket is bound to with ``SO_BINDTODEVICE``. Linux only, and it requires ``CAP_NET_RAW``. If it cannot be applied, the socket stays bound to all interfaces. Default: None
         """
 
         self._transport: Any = None
@@ -75,11 +135,28 @@ class GoveeController:
         self._listening_address = listening_address
         self._listening_port = listening_port
         self._device_command_port = device_command_port
+        self._receive_buffer_size = receive_buffer_size
+        self._send_buffer_size = send_buffer_size
+        self._interface = interface
+
+        self._is_multicast = ipaddress.ip_address(broadcast_address).is_multicast
+        self._listening_address_packed: bytes | None = None
+        self._membership_request: bytes | None = None
+        if self._is_multicast:
+            self._listening_address_packed = socket.inet_aton(listening_address)
+            self._membership_request = (
+                socket.inet_aton(broadcast_address) + self._listening_address_packed
+            )
 
         self._loop = loop or asyncio.get_running_loop()
         self._cleanup_done: asyncio.Event = asyncio.Event()
         self._message_factory = MessageResponseFactory()
+        self._scan_payload = bytes(ScanMessage())
+        self._status_payload = bytes(StatusMessage())
         self._devices: dict[str, GoveeDevice] = {}
+        self._devices_by_ip: dict[str, GoveeDevice] = {}
+        self._devices_by_sku: dict[str, list[GoveeDevice]] = {}
+        self._last_status_request: dict[str, float] = {}
 
         self._discovery_enabled = discovery_enabled
         self._discovery_interval = discovery_interval
@@ -93,8 +170,13 @@ class GoveeController:
 
         self._logger = logger or logging.getLogger(__name__)
 
-        self._discovery_handle: asyncio.TimerHandle | None = None
-        self._update_handle: asyncio.TimerHandle | None = None
+        self._discovery_task: asyncio.Task | None = None
+        self._update_task: asyncio.Task | None = None
+
+        self._response_handlers: dict[str, Callable[[Any, tuple, float], None]] = {
+            ScanResponse.command: self._handle_scan_response,
+            StatusResponse.command: self._handle_status_update_response,
+        }
 
     async def start(self):
         self._transport, self._protocol = await self._loop.create_datagram_endpoint(
@@ -102,9 +184,9 @@ class GoveeController:
         )
 
         if self._discovery_enabled:
-            self.send_discovery_message()
+            self._start_discovery_task()
         if self._update_enabled:
-            self.send_update_message()
+            self._start_update_task()
 
     def cleanup(self) -> asyncio.Event:
         self._cleanup_done.clear()
@@ -114,6 +196,9 @@ class GoveeController:
         if self._transport:
             self._transport.close()
         self._devices.clear()
+        self._devices_by_ip.clear()
+        self._devices_by_sku.clear()
+        self._last_status_request.clear()
         return self._cleanup_done
 
     def add_device(
@@ -121,16 +206,17 @@ class GoveeController:
         ip: str,
         sku: str,
         fingerprint,
-        capabilities: set[GoveeLightCapability] | None,
+        capabilities: AbstractSet[GoveeLightCapability] | None,
     ) -> None:
         device: GoveeDevice = GoveeDevice(self, ip, fingerprint, sku, capabilities)
-        self._devices[fingerprint] = device
+        self._register(device)
 
     def remove_device(self, device: str | GoveeDevice) -> None:
         if isinstance(device, GoveeDevice):
             device = device.fingerprint
-        if device in self._devices:
-            del self._devices[device]
+        existing = self._devices.get(device)
+        if existing is not None:
+            self._unregister(existing)
 
     @property
     def evict_enabled(self) -> bool:
@@ -144,10 +230,10 @@ class GoveeController:
             return
         self._discovery_enabled = enabled
         if enabled:
-            self.send_discovery_message()
-        elif self._discovery_handle:
-            self._discovery_handle.cancel()
-            self._discovery_handle = None
+            self._start_discovery_task()
+        elif self._discovery_task:
+            self._discovery_task.cancel()
+            self._discovery_task = None
 
     @property
     def discovery(self) -> bool:
@@ -172,39 +258,28 @@ class GoveeController:
             return
         self._update_enabled = enabled
         if enabled:
-            self.send_update_message()
-        elif self._update_handle:
-            self._update_handle.cancel()
-            self._update_handle = None
+            self._start_update_task()
+        elif self._update_task:
+            self._update_task.cancel()
+            self._update_task = None
 
     @property
     def update_enabled(self) -> bool:
         return self._update_enabled
 
     def send_discovery_message(self) -> None:
-        message: ScanMessage = ScanMessage()
         if self._transport:
             self._transport.sendto(
-                bytes(message), (self._broadcast_address, self._broadcast_port)
+                self._scan_payload, (self._broadcast_address, self._broadcast_port)
             )
 
-            if self._discovery_enabled:
-                self._discovery_handle = self._loop.call_later(
-                    self._discovery_interval, self.send_discovery_message
-                )
-
     def send_update_message(self, device: GoveeDevice | None = None) -> None:
         if self._transport:
             if device:
-                self._send_update_message(device=device)
+                self._send_update_message(device)
             else:
                 for d in self._devices.values():
-                    self._send_update_message(device=d)
-
-            if self._update_enabled:
-                self._update_handle = self._loop.call_later(
-                    self._update_interval, self.send_update_message
-                )
+                    self._send_update_message(d)
 
     async def turn_on_off(self, device: GoveeDevice, status: bool) -> None:
         self._send_message(OnOffMessage(status), device)
@@ -225,15 +300,11 @@ class GoveeController:
             self._send_message(ColorMessage(rgb=None, temperature=temperature), device)
 
     def get_device_by_ip(self, ip: str) -> GoveeDevice | None:
-        return next(
-            (device for device in self._devices.values() if device.ip == ip),
-            None,
-        )
+        return self._devices_by_ip.get(ip)
 
     def get_device_by_sku(self, sku: str) -> GoveeDevice | None:
-        return next(
-            (device for device in self._devices.values() if device.sku == sku), None
-        )
+        devices = self._devices_by_sku.get(sku)
+        return devices[0] if devices else None
 
     def get_device_by_fingerprint(self, fingerprint: str) -> GoveeDevice | None:
         return self._devices.get(fingerprint, None)
@@ -249,33 +320,55 @@ class GoveeController:
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
-        broadcast_ip = ipaddress.ip_address(self._broadcast_address)
+        try:
+            if self._receive_buffer_size:
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, self._receive_buffer_size
+                )
+            if self._send_buffer_size:
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, self._send_buffer_size
+                )
+        except OSError as err:
+            self._logger.debug("Unable to resize socket buffers: %s", err)
+
+        if self._interface:
+            self._bind_to_interface(sock, self._interface)
 
-        if broadcast_ip.is_multicast:
+        if self._is_multicast:
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
 
             sock.setsockopt(
-                socket.SOL_IP,
-                socket.IP_MULTICAST_IF,
-                socket.inet_aton(self._listening_address),
+                socket.SOL_IP, socket.IP_MULTICAST_IF, self._listening_address_packed
             )
             sock.setsockopt(
-                socket.SOL_IP,
-                socket.IP_ADD_MEMBERSHIP,
-                socket.inet_aton(self._broadcast_address)
-                + socket.inet_aton(self._listening_address),
+                socket.SOL_IP, socket.IP_ADD_MEMBERSHIP, self._membership_request
+            )
+
+    def _bind_to_interface(self, sock, interface: str) -> None:
+        if not hasattr(socket, "SO_BINDTODEVICE"):
+            self._logger.warning(
+                "Binding to interface %s is not supported on this platform",
+                interface,
+            )
+            return
+        try:
+            sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_BINDTODEVICE,
+                interface.encode() + b"\0",
+            )
+        except OSError as err:
+            self._logger.warning(
+                "Unable to bind socket to interface %s: %s", interface, err
             )
 
     def connection_lost(self, *args, **kwargs):
         if self._transport:
-            broadcast_ip = ipaddress.ip_address(self._broadcast_address)
-            if broadcast_ip.is_multicast:
+            if self._is_multicast:
                 sock = self._transport.get_extra_info("socket")
                 sock.setsockopt(
-                    socket.SOL_IP,
-                    socket.IP_DROP_MEMBERSHIP,
-                    socket.inet_aton(self._broadcast_address)
-                    + socket.inet_aton(self._listening_address),
+                    socket.SOL_IP, socket.IP_DROP_MEMBERSHIP, self._membership_request
                 )
         self._cleanup_done.set()
         self._logger.debug("Disconnected")
@@ -285,78 +378,143 @@ class GoveeController:
             return
         message = self._message_factory.create_message(data)
         if not message:
-            if self._logger.isEnabledFor(logging.DEBUG):
-                self._logger.debug(
-                    "Unknown message received from %s. Message: %s", addr, data
-                )
             self._logger.warning(
-                "Unknown message received from %s. Message: %s", addr, data[:50]
+                "Unknown message received from %s. Message: %s",
+                addr,
+                _LazyBytesHead(data, 50),
             )
 
             return
 
-        if message.command == ScanResponse.command:
-            self._loop.create_task(
-                self._handle_scan_response(cast(ScanResponse, message))
-            )
-        elif message.command == StatusResponse.command:
-            self._handle_status_update_response(cast(StatusResponse, message), addr)
-
-    def _send_update_message(self, device: GoveeDevice):
-        self._send_message(StatusMessage(), device)
+        handler = self._response_handlers.get(message.command)
+        if handler:
+            handler(message, addr, time.monotonic())
+
+    def _start_discovery_task(self) -> None:
+        if self._transport and not self._discovery_task:
+            self._discovery_task = self._loop.create_task(self._discovery_loop())
+
+    def _start_update_task(self) -> None:
+        if self._transport and not self._update_task:
+            self._update_task = self._loop.create_task(self._update_loop())
+
+    async def _discovery_loop(self) -> None:
+        try:
+            while self._discovery_enabled:
+                self.send_discovery_message()
+                await asyncio.sleep(self._discovery_interval)
+        finally:
+            if self._discovery_task is asyncio.current_task():
+                self._discovery_task = None
+
+    async def _update_loop(self) -> None:
+        try:
+            while self._update_enabled:
+                self.send_update_message()
+                await asyncio.sleep(self._update_interval)
+        finally:
+            if self._update_task is asyncio.current_task():
+                self._update_task = None
+
+    def _send_update_message(self, device: GoveeDevice) -> None:
+        now = time.monotonic()
+        last_request = self._last_status_request.get(device.fingerprint)
+        if (
+            last_request is not None
+            and now - last_request < STATUS_REQUEST_MIN_INTERVAL
+        ):
+            return
+        self._last_status_request[device.fingerprint] = now
+        self._transport.sendto(
+            self._status_payload, (device.ip, self._device_command_port)
+        )
 
-    def _handle_status_update_response(self, message: StatusResponse, addr):
+    def _handle_status_update_response(
+        self, message: StatusResponse, addr, now: float
+    ) -> None:
         ip = addr[0]
         device = self.get_device_by_ip(ip)
         if device:
-            device.update(message)
+            self._last_status_request.pop(device.fingerprint, None)
+            device.update(message, now)
 
-    async def _handle_scan_response(self, message: ScanResponse) -> None:
+    def _handle_scan_response(self, message: ScanResponse, addr, now: float) -> None:
         fingerprint = message.device
-        device = self.get_device_by_fingerprint(fingerprint)
+        device = self._devices.get(fingerprint)
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
 
         if device is None:
-            capabilities = GOVEE_LIGHT_CAPABILITIES.get(message.sku, None)
-            if not capabilities:
+            capabilities = GOVEE_LIGHT_CAPABILITIES.get(message.sku)
+            if capabilities is None:
                 self._logger.warning(
                     "Device %s is not supported. Only power control is available. Please open an issue at 'https://github.com/Galorhallen/govee-local-api/issues'",
                     message.sku,
                 )
             device = GoveeDevice(
-                self, message.ip, fingerprint, message.sku, capabilities
+                self, message.ip, fingerprint, message.sku, capabilities, now
             )
             if self._call_discovered_callback(device, True):
-                self._devices[fingerprint] = device
-                self._logger.debug("Device discovered: %s", device)
-            else:
+                self._register(device)
+                if debug_enabled:
+                    self._logger.debug("Device discovered: %s", device)
+            elif debug_enabled:
                 self._logger.debug("Device %s ignored", device)
         else:
             if self._call_discovered_callback(device, False):
-                device.update_lastseen()
-                self._logger.debug("Device updated: %s", device)
+                if device.ip != message.ip:
+                    self._unregister(device)
+                    device._ip = message.ip
+                    self._register(device)
+                device.update_lastseen(now)
+                if debug_enabled:
+                    self._logger.debug("Device updated: %s", device)
 
         if self._evict_enabled:
-            self._evict()
+            self._evict(now)
 
     def _call_discovered_callback(self, device: GoveeDevice, is_new: bool) -> bool:
         if not self._device_discovered_callback:
             return True
         return self._device_discovered_callback(device, is_new)
 
+    def _register(self, device: GoveeDevice) -> None:
+        previous = self._devices.get(device.fingerprint)
+        if previous is not None:
+            self._unregister(previous)
+        self._devices[device.fingerprint] = device
+        self._devices_by_ip[device.ip] = device
+        self._devices_by_sku.setdefault(device.sku, []).append(device)
+
+    def _unregister(self, device: GoveeDevice) -> None:
+        self._devices.pop(device.fingerprint, None)
+        if self._devices_by_ip.get(device.ip) is device:
+            del self._devices_by_ip[device.ip]
+        same_sku = self._devices_by_sku.get(device.sku)
+        if same_sku and device in same_sku:
+            same_sku.remove(device)
+            if not same_sku:
+                del self._devices_by_sku[device.sku]
+        self._last_status_request.pop(device.fingerprint, None)
+
     def _send_message(self, message: GoveeMessage, device: GoveeDevice) -> None:
         self._transport.sendto(bytes(message), (device.ip, self._device_command_port))
 
-    def _evict(self) -> None:
-        now = datetime.now()
-        devices = dict(self._devices)
-        for fingerprint, device in devices.items():
-            diff: timedelta = now - device.lastseen
-            if diff.total_seconds() >= self._evict_interval:
-                device._controller = None
-                del self._devices[fingerprint]
-                if self._device_evicted_callback and callable(
-                    self._device_evicted_callback
-                ):
+    def _evict(self, now: float) -> None:
+        cutoff = now - self._evict_interval
+        evicted = [
+            device
+            for device in self._devices.values()
+            if device.lastseen_monotonic <= cutoff
+        ]
+        if not evicted:
+            return
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        for device in evicted:
+            device._controller = None
+            self._unregister(device)
+            if self._device_evicted_callback and callable(
+                self._device_evicted_callback
+            ):
+                if debug_enabled:
                     self._logger.debug("Device evicted: %s", device)
-                    self._device_evicted_callback(device)
-        self._devices = devices
+                self._device_evicted_callback(device)
@@ -1,40 +1,71 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Callable, Tuple
+from datetime import datetime, timedelta
+import sys
+import time
+from typing import AbstractSet, Any, Callable, Tuple
 
 from .light_capabilities import GoveeLightCapability
-from .message import StatusResponse
+from .message import StatusResponse, _clamp
+
+
+def _pack_rgb(rgb: Tuple[int, int, int]) -> int:
+    red, green, blue = rgb
+    return (
+        (_clamp(int(red), 0, 255) << 16)
+        | (_clamp(int(green), 0, 255) << 8)
+        | _clamp(int(blue), 0, 255)
+    )
 
 
 class GoveeDevice:
+    __slots__ = (
+        "_controller",
+        "_fingerprint",
+        "_sku",
+        "_ip",
+        "_lastseen_monotonic",
+        "_capabilities",
+        "_is_on",
+        "_rgb_color",
+        "_temperature_color",
+        "_brightness",
+        "_update_callback",
+        "_as_dict_cache",
+        "_str_cache",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         controller,
         ip: str,
         fingerprint: str,
         sku: str,
-        capabilities: set[GoveeLightCapability] | None,
+        capabilities: AbstractSet[GoveeLightCapability] | None,
+        now: float | None = None,
     ) -> None:
         self._controller = controller
         self._fingerprint = fingerprint
-        self._sku = sku
+        self._sku = sys.intern(sku)
         self._ip = ip
-        self._lastseen: datetime = datetime.now()
-        self._capabilities: set[GoveeLightCapability] | None = capabilities
+        self._lastseen_monotonic: float = time.monotonic() if now is None else now
+        self._capabilities: AbstractSet[GoveeLightCapability] | None = capabilities
 
         self._is_on: bool = False
-        self._rgb_color = (0, 0, 0)
+        self._rgb_color: int = 0
         self._temperature_color = 0
         self._brightness = 0
         self._update_callback: Callable[[GoveeDevice], None] | None = None
+        self._as_dict_cache: dict[str, Any] | None = None
+        self._str_cache: str | None = None
 
     @property
     def controller(self):
         return self._controller
 
     @property
-    def capabilities(self) -> set[GoveeLightCapability] | None:
+    def capabilities(self) -> AbstractSet[GoveeLightCapability] | None:
         return self._capabilities
 
     @property
@@ -51,7 +82,13 @@ class GoveeDevice:
 
     @property
     def lastseen(self) -> datetime:
-        return self._lastseen
+        elapsed = time.monotonic() - self._lastseen_monotonic
+        return datetime.now() - timedelta(seconds=elapsed)
+
+    @property
+    def lastseen_monotonic(self) -> float:
+        """Last time the device was seen, as a ``time.monotonic()`` value."""
+        return self._lastseen_monotonic
 
     @property
     def on(self) -> bool:
@@ -59,7 +96,8 @@ class GoveeDevice:
 
     @property
     def rgb_color(self) -> Tuple[int, int, int]:
-        return self._rgb_color
+        rgb = self._rgb_color
+        return ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
 
     @property
     def brightness(self) -> int:
@@ -83,52 +121,82 @@ class GoveeDevice:
     async def turn_on(self) -> None:
         await self._controller.turn_on_off(self, True)
         self._is_on = True
+        self._invalidate_caches()
 
     async def turn_off(self) -> None:
         await self._controller.turn_on_off(self, False)
         self._is_on = False
+        self._invalidate_caches()
 
     async def set_brightness(self, value: int) -> None:
         await self._controller.set_brightness(self, value)
         self._brightness = value
+        self._invalidate_caches()
 
     async def set_rgb_color(self, red: int, green: int, blue: int) -> None:
         rgb = (red, green, blue)
         await self._controller.set_color(self, rgb=rgb, temperature=None)
-        self._rgb_color = rgb
+        self._rgb_color = _pack_rgb(rgb)
+        self._invalidate_caches()
 
     async def set_temperature(self, temperature: int) -> None:
         await self._controller.set_color(self, temperature=temperature, rgb=None)
         self._temperature_color = temperature
-
-    def update(self, message: StatusResponse) -> None:
-        self._is_on = message.is_on
-        self._brightness = message.brightness
-        self._rgb_color = message.color
-        self._temperature_color = message.color_temperature
-        self.update_lastseen()
-        if self._update_callback and callable(self._update_callback):
-            self._update_callback(self)
-
-    def update_lastseen(self) -> None:
-        self._lastseen = datetime.now()
+        self._invalidate_caches()
+
+    def update(self, message: StatusResponse, now: float | None = None) -> None:
+        state = (
+            message.is_on,
+            message.brightness,
+            _pack_rgb(message.color),
+            message.color_temperature,
+        )
+        self.update_lastseen(now)
+        if state == (
+            self._is_on,
+            self._brightness,
+            self._rgb_color,
+            self._temperature_color,
+        ):
+            return
+        (
+            self._is_on,
+            self._brightness,
+            self._rgb_color,
+            self._temperature_color,
+        ) = state
+        callback = self._update_callback
+        if callback is not None:
+            callback(self)
+
+    def update_lastseen(self, now: float | None = None) -> None:
+        self._lastseen_monotonic = time.monotonic() if now is None else now
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        self._as_dict_cache = None
+        self._str_cache = None
 
     def as_dict(self) -> dict[str, Any]:
-        return {
-            "ip": self._ip,
-            "fingerprint": self._fingerprint,
-            "sku": self._sku,
-            "lastseen": self._lastseen,
-            "on": self._is_on,
-            "brightness": self._brightness,
-            "color": self._rgb_color,
-            "colorTemperature": self._temperature_color,
-        }
+        if self._as_dict_cache is None:
+            self._as_dict_cache = {
+                "ip": self._ip,
+                "fingerprint": self._fingerprint,
+                "sku": self._sku,
+                "lastseen": self.lastseen,
+                "on": self._is_on,
+                "brightness": self._brightness,
+                "color": self.rgb_color,
+                "colorTemperature": self._temperature_color,
+            }
+        return dict(self._as_dict_cache)
 
     def __str__(self) -> str:
-        result = f"<GoveeDevice ip={self.ip}, fingerprint={self.fingerprint}, sku={self.sku}, lastseen={self._lastseen}, is_on={self._is_on}"
-        return result + (
-            f", brightness={self._brightness}, color={self._rgb_color}, temperature={self._temperature_color}>"
-            if self._is_on
-            else ">"
-        )
+        if self._str_cache is None:
+            result = f"<GoveeDevice ip={self.ip}, fingerprint={self.fingerprint}, sku={self.sku}, lastseen={self.lastseen}, is_on={self._is_on}"
+            self._str_cache = result + (
+                f", brightness={self._brightness}, color={self.rgb_color}, temperature={self._temperature_color}>"
+                if self._is_on
+                else ">"
+            )
+        return self._str_cache
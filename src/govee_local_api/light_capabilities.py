@@ -9,487 +9,122 @@ class GoveeLightCapability(Enum):
     BRIGHTNESS = auto()
 
 
-GOVEE_LIGHT_CAPABILITIES: dict[str, set[GoveeLightCapability]] = {
-    "H6046": {
+COMMON_CAPABILITIES: frozenset[GoveeLightCapability] = frozenset(
+    {
         GoveeLightCapability.COLOR_RGB,
         GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
         GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6047": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6051": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6056": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6059": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6061": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6062": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6065": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6066": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6067": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6072": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6073": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6076": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6078": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6087": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H610A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H610B": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6110": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6117": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6159": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H615A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H615B": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H615C": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H615D": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H615E": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6163": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6168": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6172": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6173": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H618A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H618C": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H618E": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H618F": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H619A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H619B": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H619C": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H619D": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H619E": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H619Z": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61A0": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61A1": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61A2": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61A3": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61A5": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61A8": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61B2": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61BA": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61BC": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61E1": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7012": {
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7013": {
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7021": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7028": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7041": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7042": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7050": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7051": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7055": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H705A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H705B": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H705C": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H705E": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7060": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7063": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7061": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7062": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7065": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7066": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
+    }
+)
+BRIGHTNESS_CAPABILITIES: frozenset[GoveeLightCapability] = frozenset(
+    {GoveeLightCapability.BRIGHTNESS}
+)
+
+_COMMON_SKUS = (
+    "H6046",
+    "H6047",
+    "H6051",
+    "H6056",
+    "H6059",
+    "H6061",
+    "H6062",
+    "H6065",
+    "H6066",
+    "H6067",
+    "H6072",
+    "H6073",
+    "H6076",
+    "H6078",
+    "H6087",
+    "H610A",
+    "H610B",
+    "H6110",
+    "H6117",
+    "H6159",
+    "H615A",
+    "H615B",
+    "H615C",
+    "H615D",
+    "H615E",
+    "H6163",
+    "H6168",
+    "H6172",
+    "H6173",
+    "H618A",
+    "H618C",
+    "H618E",
+    "H618F",
+    "H619A",
+    "H619B",
+    "H619C",
+    "H619D",
+    "H619E",
+    "H619Z",
+    "H61A0",
+    "H61A1",
+    "H61A2",
+    "H61A3",
+    "H61A5",
+    "H61A8",
+    "H61B2",
+    "H61BA",
+    "H61BC",
+    "H61E1",
+    "H7021",
+    "H7028",
+    "H7041",
+    "H7042",
+    "H7050",
+    "H7051",
+    "H7055",
+    "H705A",
+    "H705B",
+    "H705C",
+    "H705E",
+    "H7060",
+    "H7063",
+    "H7061",
+    "H7062",
+    "H7065",
+    "H7066",
     # User reported devices
-    "H7033": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H70C1": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H70C2": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6052": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6088": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H608A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H606A": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61C5": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7020": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61BE": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61B5": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61C3": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61D3": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61D5": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H608B": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H608D": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6175": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6176": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7037": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7038": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7039": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7052": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H61E0": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H6079": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H607C": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H7075": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H60A1": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H70B1": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
-    "H70A1": {
-        GoveeLightCapability.COLOR_RGB,
-        GoveeLightCapability.COLOR_KELVIN_TEMPERATURE,
-        GoveeLightCapability.BRIGHTNESS,
-    },
+    "H7033",
+    "H70C1",
+    "H70C2",
+    "H6052",
+    "H6088",
+    "H608A",
+    "H606A",
+    "H61C5",
+    "H7020",
+    "H61BE",
+    "H61B5",
+    "H61C3",
+    "H61D3",
+    "H61D5",
+    "H608B",
+    "H608D",
+    "H6175",
+    "H6176",
+    "H7037",
+    "H7038",
+    "H7039",
+    "H7052",
+    "H61E0",
+    "H6079",
+    "H607C",
+    "H7075",
+    "H60A1",
+    "H70B1",
+    "H70A1",
+)
+
+_BRIGHTNESS_ONLY_SKUS = (
+    "H7012",
+    "H7013",
+)
+
+GOVEE_LIGHT_CAPABILITIES: dict[str, frozenset[GoveeLightCapability]] = {
+    **dict.fromkeys(_COMMON_SKUS, COMMON_CAPABILITIES),
+    **dict.fromkeys(_BRIGHTNESS_ONLY_SKUS, BRIGHTNESS_CAPABILITIES),
 }
@@ -1,24 +1,57 @@
 from __future__ import absolute_import, annotations
 
 import json
-from typing import Any, Tuple, TypeVar, Type, Set
+from typing import Any, Callable, Tuple, TypeVar, Type
+
+_json_loads: Callable[..., Any]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+    _json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def _json_dumps(obj: Any) -> str:
+        return _json_encoder.encode(obj)
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    return low if value < low else high if value > high else value
 
 
 class GoveeMessage:
+    __slots__ = ("_data", "_bytes")
+
     command: str = ""
     _data: dict[str, Any]
+    _bytes: bytes | None
 
     def __init__(self, data: dict[str, Any]) -> None:
         self._data = data
+        self._bytes = None
 
     def as_dict(self) -> dict[str, Any]:
         return {"msg": {"cmd": self.command, "data": self.data}}
 
     def as_json(self) -> str:
-        return json.dumps(self.as_dict(), separators=(",", ":"))
+        return _json_dumps(self.as_dict())
 
     def __bytes__(self) -> bytearray | bytes:
-        return self.as_json().encode("utf-8")
+        if self._bytes is None:
+            self._bytes = self._encode()
+        return self._bytes
+
+    def _encode(self) -> bytes:
+        return b'{"msg":{"cmd":"%s","data":%s}}' % (
+            self.command.encode("utf-8"),
+            _json_dumps(self._data).encode("utf-8"),
+        )
 
     def __str__(self) -> str:
         return self.as_json()
@@ -32,34 +65,56 @@ M = TypeVar("M", bound=GoveeMessage)
 
 
 class ScanMessage(GoveeMessage):
+    __slots__ = ()
+
     command = "scan"
 
     def __init__(self) -> None:
         super().__init__({"account_topic": "reserve"})
 
+    def _encode(self) -> bytes:
+        return b'{"msg":{"cmd":"scan","data":{"account_topic":"reserve"}}}'
+
 
 class StatusMessage(GoveeMessage):
+    __slots__ = ()
+
     command = "devStatus"
 
     def __init__(self) -> None:
         super().__init__({})
 
+    def _encode(self) -> bytes:
+        return b'{"msg":{"cmd":"devStatus","data":{}}}'
+
 
 class OnOffMessage(GoveeMessage):
+    __slots__ = ()
+
     command = "turn"
 
     def __init__(self, on: bool) -> None:
         super().__init__({"value": int(on)})
 
+    def _encode(self) -> bytes:
+        return b'{"msg":{"cmd":"turn","data":{"value":%d}}}' % self._data["value"]
+
 
 class BrightnessMessage(GoveeMessage):
+    __slots__ = ()
+
     command = "brightness"
 
     def __init__(self, brightness_pct: int) -> None:
-        super().__init__({"value": max(0, min(brightness_pct, 100))})
+        super().__init__({"value": _clamp(int(brightness_pct), 0, 100)})
+
+    def _encode(self) -> bytes:
+        return b'{"msg":{"cmd":"brightness","data":{"value":%d}}}' % self._data["value"]
 
 
 class ColorMessage(GoveeMessage):
+    __slots__ = ()
+
     TEMPERATURE_MAX_KELVIN = 9000
     TEMPERATURE_MIN_KELVIN = 2000
 
@@ -69,24 +124,38 @@ class ColorMessage(GoveeMessage):
         self, *, rgb: Tuple[int, int, int] | None, temperature: int | None
     ) -> None:
         if rgb:
-            nrgb = [max(0, min(c, 255)) for c in rgb]
+            red, green, blue = rgb
             data = {
-                "color": {"r": nrgb[0], "g": nrgb[1], "b": nrgb[2]},
+                "color": {
+                    "r": _clamp(int(red), 0, 255),
+                    "g": _clamp(int(green), 0, 255),
+                    "b": _clamp(int(blue), 0, 255),
+                },
                 "colorTemInKelvin": 0,
             }
         elif temperature:
             data = {
                 "color": {"r": 0, "g": 0, "b": 0},
-                "colorTemInKelvin": max(
+                "colorTemInKelvin": _clamp(
+                    int(temperature),
                     self.TEMPERATURE_MIN_KELVIN,
-                    min(temperature, self.TEMPERATURE_MAX_KELVIN),
+                    self.TEMPERATURE_MAX_KELVIN,
                 ),
             }
 
         super().__init__(data)
 
+    def _encode(self) -> bytes:
+        color = self._data["color"]
+        return (
+            b'{"msg":{"cmd":"colorwc","data":{"color":{"r":%d,"g":%d,"b":%d},"colorTemInKelvin":%d}}}'
+            % (color["r"], color["g"], color["b"], self._data["colorTemInKelvin"])
+        )
+
 
 class ScanResponse(GoveeMessage):
+    __slots__ = ()
+
     command = "scan"
 
     def __init__(self, data: dict[str, Any]) -> None:
@@ -106,6 +175,8 @@ class ScanResponse(GoveeMessage):
 
 
 class StatusResponse(GoveeMessage):
+    __slots__ = ()
+
     command = "devStatus"
 
     def __init__(self, data: dict[str, Any]) -> None:
@@ -131,21 +202,30 @@ class StatusResponse(GoveeMessage):
 
 class MessageResponseFactory:
     def __init__(self) -> None:
-        self._messages: Set[Type[GoveeMessage]] = {ScanResponse, StatusResponse}
+        self._messages: dict[str, Type[GoveeMessage]] = {
+            ScanResponse.command: ScanResponse,
+            StatusResponse.command: StatusResponse,
+        }
 
     def create_message(self, data: bytes | bytearray | str) -> GoveeMessage | None:
-        msg_json = json.loads(data)
-        if (
-            "msg" not in msg_json
-            or "cmd" not in msg_json["msg"]
-            and "data" not in msg_json["msg"]
-        ):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if b'"msg"' not in data:
             return None
-        cmd: str = msg_json["msg"]["cmd"]
-        message_data: dict[str, Any] = msg_json["msg"]["data"]
-        message: Type[GoveeMessage] = next(
-            m for m in self._messages if m.command == cmd
-        )
+        try:
+            msg_json = _json_loads(data)
+        except ValueError:
+            return None
+        if not isinstance(msg_json, dict):
+            return None
+        msg = msg_json.get("msg")
+        if not isinstance(msg, dict) or "cmd" not in msg or "data" not in msg:
+            return None
+        cmd = msg["cmd"]
+        payload = msg["data"]
+        if not isinstance(cmd, str) or not isinstance(payload, dict):
+            return None
+        message = self._messages.get(cmd)
         if not message:
             return None
-        return message(message_data)
+        return message(payload)
@@ -0,0 +1,314 @@
+from __future__ import absolute_import
+
+import asyncio
+import json
+import logging
+import socket
+import time
+import weakref
+from datetime import datetime
+
+import pytest
+
+from govee_local_api.controller import GoveeController
+
+
+@pytest.fixture
+def controller():
+    loop = asyncio.new_event_loop()
+    yield GoveeController(loop=loop, update_enabled=False)
+    loop.close()
+
+
+def test_get_device_by_ip_and_sku(controller: GoveeController):
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+    controller.add_device("10.0.0.2", "H6046", "CC:DD", None)
+
+    assert controller.get_device_by_ip("10.0.0.1").fingerprint == "AA:BB"
+    assert controller.get_device_by_ip("10.0.0.2").fingerprint == "CC:DD"
+    assert controller.get_device_by_ip("10.0.0.3") is None
+    assert controller.get_device_by_sku("H6046").fingerprint == "AA:BB"
+    assert controller.get_device_by_sku("H6047") is None
+
+
+def test_remove_device_updates_lookups(controller: GoveeController):
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+    controller.add_device("10.0.0.2", "H6046", "CC:DD", None)
+
+    controller.remove_device("AA:BB")
+
+    assert controller.get_device_by_ip("10.0.0.1") is None
+    assert controller.get_device_by_sku("H6046").fingerprint == "CC:DD"
+
+    controller.remove_device(controller.get_device_by_fingerprint("CC:DD"))
+
+    assert controller.get_device_by_sku("H6046") is None
+    assert controller.devices == []
+
+
+def test_evict_removes_only_stale_devices(controller: GoveeController):
+    evicted = []
+    controller._device_evicted_callback = evicted.append
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+    controller.add_device("10.0.0.2", "H6046", "CC:DD", None)
+    stale = controller.get_device_by_fingerprint("AA:BB")
+    stale.update_lastseen(time.monotonic() - controller._evict_interval - 1)
+
+    controller._evict(time.monotonic())
+
+    assert evicted == [stale]
+    assert stale.controller is None
+    assert [d.fingerprint for d in controller.devices] == ["CC:DD"]
+    assert controller.get_device_by_ip("10.0.0.1") is None
+
+
+class _FakeTransport:
+    def __init__(self) -> None:
+        self.sent: list[tuple[bytes, tuple]] = []
+
+    def sendto(self, data: bytes, addr: tuple) -> None:
+        self.sent.append((data, addr))
+
+    def close(self) -> None:
+        pass
+
+
+def test_update_task_is_not_duplicated(controller: GoveeController):
+    async def toggle():
+        controller._transport = _FakeTransport()
+        controller.set_update_enabled(True)
+        first_task = controller._update_task
+        controller.set_update_enabled(False)
+        controller.set_update_enabled(True)
+        controller.set_update_enabled(True)
+        await asyncio.sleep(0)
+        assert first_task.cancelled()
+        assert controller._update_task is not None
+        assert controller._update_task is not first_task
+        controller.set_update_enabled(False)
+        assert controller._update_task is None
+
+    controller._loop.run_until_complete(toggle())
+
+
+def _scan_response(ip: str, fingerprint: str, sku: str) -> bytes:
+    return json.dumps(
+        {"msg": {"cmd": "scan", "data": {"ip": ip, "device": fingerprint, "sku": sku}}}
+    ).encode()
+
+
+def test_scan_response_is_handled_inline(controller: GoveeController):
+    controller.datagram_received(
+        _scan_response("10.0.0.1", "AA:BB", "H6046"), ("10.0.0.1", 4002)
+    )
+
+    device = controller.get_device_by_fingerprint("AA:BB")
+    assert device is not None
+    assert controller.get_device_by_ip("10.0.0.1") is device
+
+    controller.datagram_received(
+        _scan_response("10.0.0.9", "AA:BB", "H6046"), ("10.0.0.9", 4002)
+    )
+
+    assert controller.get_device_by_ip("10.0.0.1") is None
+    assert controller.get_device_by_ip("10.0.0.9") is device
+    assert device.ip == "10.0.0.9"
+
+
+def test_one_shot_sends_do_not_schedule(controller: GoveeController):
+    transport = _FakeTransport()
+    controller._transport = transport
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+    device = controller.get_device_by_fingerprint("AA:BB")
+
+    controller.send_update_message(device)
+    controller.send_discovery_message()
+
+    assert [addr for _, addr in transport.sent] == [
+        ("10.0.0.1", 4003),
+        ("239.255.255.250", 4001),
+    ]
+    assert controller._update_task is None
+    assert controller._discovery_task is None
+
+
+def test_non_multicast_controller_accepts_hostname():
+    loop = asyncio.new_event_loop()
+    try:
+        controller = GoveeController(
+            loop=loop,
+            broadcast_address="127.255.255.255",
+            listening_address="localhost",
+            update_enabled=False,
+        )
+        assert controller._listening_address_packed is None
+        assert controller._membership_request is None
+    finally:
+        loop.close()
+
+
+def _status_response() -> bytes:
+    return json.dumps(
+        {
+            "msg": {
+                "cmd": "devStatus",
+                "data": {
+                    "onOff": 1,
+                    "brightness": 50,
+                    "color": {"r": 0, "g": 0, "b": 0},
+                    "colorTemInKelvin": 0,
+                },
+            }
+        }
+    ).encode()
+
+
+def test_status_requests_are_throttled(controller: GoveeController):
+    transport = _FakeTransport()
+    controller._transport = transport
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+    device = controller.get_device_by_fingerprint("AA:BB")
+
+    controller.send_update_message(device)
+    controller.send_update_message(device)
+    assert len(transport.sent) == 1
+
+    controller.datagram_received(_status_response(), ("10.0.0.1", 4002))
+    controller.send_update_message(device)
+    assert len(transport.sent) == 2
+
+    assert "AA:BB" in controller._last_status_request
+    controller._unregister(device)
+    assert "AA:BB" not in controller._last_status_request
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+    controller.send_update_message(controller.get_device_by_fingerprint("AA:BB"))
+    assert len(transport.sent) == 3
+
+
+def test_lastseen_ignores_loop_clock(controller: GoveeController):
+    controller._loop.time = lambda: time.monotonic() + 3600
+    controller._evict_enabled = True
+    controller.datagram_received(
+        _scan_response("10.0.0.1", "AA:BB", "H6046"), ("10.0.0.1", 4002)
+    )
+    device = controller.get_device_by_fingerprint("AA:BB")
+
+    assert abs((device.lastseen - datetime.now()).total_seconds()) < 5
+
+    device.update_lastseen()
+    assert device.lastseen_monotonic <= time.monotonic()
+    controller.datagram_received(
+        _scan_response("10.0.0.2", "CC:DD", "H6046"), ("10.0.0.2", 4002)
+    )
+
+    assert controller.get_device_by_fingerprint("AA:BB") is device
+
+
+def test_controller_is_weakly_referenceable(controller: GoveeController):
+    assert weakref.ref(controller)() is controller
+
+
+def test_first_status_request_is_sent_near_clock_zero(
+    controller: GoveeController, monkeypatch
+):
+    monkeypatch.setattr(time, "monotonic", lambda: 0.1)
+    transport = _FakeTransport()
+    controller._transport = transport
+    controller.add_device("10.0.0.1", "H6046", "AA:BB", None)
+
+    controller.send_update_message(controller.get_device_by_fingerprint("AA:BB"))
+
+    assert len(transport.sent) == 1
+
+
+class _FakeSocket:
+    def __init__(self, fail_on: tuple = ()) -> None:
+        self.options: dict[tuple[int, int], object] = {}
+        self._fail_on = fail_on
+
+    def setsockopt(self, level: int, option: int, value) -> None:
+        if option in self._fail_on:
+            raise OSError("Operation not permitted")
+        self.options[(level, option)] = value
+
+
+class _SocketTransport(_FakeTransport):
+    def __init__(self, sock: _FakeSocket) -> None:
+        super().__init__()
+        self._sock = sock
+
+    def get_extra_info(self, name: str):
+        return self._sock if name == "socket" else None
+
+
+def _connect(controller: GoveeController, sock: _FakeSocket) -> None:
+    controller.connection_made(_SocketTransport(sock))
+
+
+def test_connection_made_sizes_socket_buffers():
+    loop = asyncio.new_event_loop()
+    try:
+        controller = GoveeController(
+            loop=loop,
+            update_enabled=False,
+            receive_buffer_size=None,
+            send_buffer_size=4096,
+        )
+        sock = _FakeSocket()
+        _connect(controller, sock)
+
+        assert (socket.SOL_SOCKET, socket.SO_RCVBUF) not in sock.options
+        assert sock.options[(socket.SOL_SOCKET, socket.SO_SNDBUF)] == 4096
+    finally:
+        loop.close()
+
+
+def test_connection_made_tolerates_buffer_errors(controller: GoveeController):
+    sock = _FakeSocket(fail_on=(socket.SO_RCVBUF,))
+    _connect(controller, sock)
+
+    assert (socket.SOL_IP, socket.IP_ADD_MEMBERSHIP) in sock.options
+
+
+SO_BINDTODEVICE = getattr(socket, "SO_BINDTODEVICE", 25)
+
+
+@pytest.fixture
+def interface_controller():
+    loop = asyncio.new_event_loop()
+    yield GoveeController(loop=loop, update_enabled=False, interface="eth0")
+    loop.close()
+
+
+def test_connection_made_binds_to_interface(
+    interface_controller: GoveeController, monkeypatch
+):
+    monkeypatch.setattr(socket, "SO_BINDTODEVICE", SO_BINDTODEVICE, raising=False)
+    sock = _FakeSocket()
+    _connect(interface_controller, sock)
+
+    assert sock.options[(socket.SOL_SOCKET, SO_BINDTODEVICE)] == b"eth0\0"
+
+
+def test_interface_bind_failure_is_logged(
+    interface_controller: GoveeController, monkeypatch, caplog
+):
+    monkeypatch.setattr(socket, "SO_BINDTODEVICE", SO_BINDTODEVICE, raising=False)
+    sock = _FakeSocket(fail_on=(SO_BINDTODEVICE,))
+    with caplog.at_level(logging.WARNING):
+        _connect(interface_controller, sock)
+
+    assert "Unable to bind socket to interface eth0" in caplog.text
+    assert (socket.SOL_IP, socket.IP_ADD_MEMBERSHIP) in sock.options
+
+
+def test_interface_bind_unsupported_is_logged(
+    interface_controller: GoveeController, monkeypatch, caplog
+):
+    monkeypatch.delattr(socket, "SO_BINDTODEVICE", raising=False)
+    sock = _FakeSocket()
+    with caplog.at_level(logging.WARNING):
+        _connect(interface_controller, sock)
+
+    assert "not supported on this platform" in caplog.text
+    assert (socket.SOL_SOCKET, SO_BINDTODEVICE) not in sock.options
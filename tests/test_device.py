@@ -0,0 +1,95 @@
+from __future__ import absolute_import
+
+import asyncio
+import weakref
+
+from govee_local_api.device import GoveeDevice
+from govee_local_api.message import StatusResponse
+
+
+def _status(**overrides) -> StatusResponse:
+    data = {
+        "onOff": 1,
+        "brightness": 42,
+        "color": {"r": 64, "g": 128, "b": 255},
+        "colorTemInKelvin": 0,
+    }
+    data.update(overrides)
+    return StatusResponse(data)
+
+
+def test_update_from_status():
+    device = GoveeDevice(None, "10.0.0.1", "AA:BB", "H6046", None)
+    device.update(_status())
+
+    assert device.on
+    assert device.brightness == 42
+    assert device.rgb_color == (64, 128, 255)
+    assert device.as_dict()["color"] == (64, 128, 255)
+
+
+def test_rgb_color_is_clipped():
+    device = GoveeDevice(None, "10.0.0.1", "AA:BB", "H6046", None)
+    device.update(_status(color={"r": -5, "g": 300, "b": 7}))
+
+    assert device.rgb_color == (0, 255, 7)
+
+
+def test_as_dict_tracks_updates():
+    device = GoveeDevice(None, "10.0.0.1", "AA:BB", "H6046", None)
+    first = device.as_dict()
+    first["brightness"] = 99
+
+    assert device.as_dict()["brightness"] == 0
+
+    device.update(_status(brightness=10))
+
+    assert device.as_dict()["brightness"] == 10
+
+
+def test_str_tracks_updates():
+    device = GoveeDevice(None, "10.0.0.1", "AA:BB", "H6046", None)
+    assert str(device).endswith("is_on=False>")
+
+    device.update(_status(brightness=10))
+
+    assert "brightness=10" in str(device)
+
+
+def test_update_callback_only_on_change():
+    device = GoveeDevice(None, "10.0.0.1", "AA:BB", "H6046", None)
+    updates = []
+    device.set_update_callback(updates.append)
+
+    device.update(_status(), now=1.0)
+    device.update(_status(), now=2.0)
+
+    assert updates == [device]
+    assert device.lastseen_monotonic == 2.0
+
+    device.update(_status(brightness=10), now=3.0)
+
+    assert updates == [device, device]
+
+
+def test_device_is_weakly_referenceable():
+    device = GoveeDevice(None, "10.0.0.1", "AA:BB", "H6046", None)
+    assert weakref.ref(device)() is device
+
+
+class _RecordingController:
+    def __init__(self) -> None:
+        self.colors: list = []
+
+    async def set_color(self, device, *, rgb, temperature) -> None:
+        self.colors.append(rgb)
+
+
+def test_set_rgb_color_accepts_floats():
+    controller = _RecordingController()
+    device = GoveeDevice(controller, "10.0.0.1", "AA:BB", "H6046", None)
+
+    asyncio.run(device.set_rgb_color(64.0, 128.9, 300.0))
+
+    assert controller.colors == [(64.0, 128.9, 300.0)]
+    assert device.rgb_color == (64, 128, 255)
@@ -96,3 +96,63 @@ def test_on_off():
 
     msg: OnOffMessage = OnOffMessage(False)
     assert msg.as_dict() == {"msg": {"cmd": "turn", "data": {"value": 0}}}
+
+
+def test_bytes_are_cached():
+    msg: OnOffMessage = OnOffMessage(True)
+    encoded = bytes(msg)
+    assert encoded == b'{"msg":{"cmd":"turn","data":{"value":1}}}'
+    assert bytes(msg) is encoded
+
+
+def test_response_factory():
+    factory = MessageResponseFactory()
+    msg = factory.create_message(
+        b'{"msg":{"cmd":"scan","data":{"ip":"10.0.0.1","device":"AA:BB","sku":"H6046"}}}'
+    )
+    assert isinstance(msg, ScanResponse)
+    assert msg.ip == "10.0.0.1"
+
+    assert factory.create_message(b'{"msg":{"cmd":"unknown","data":{}}}') is None
+    assert factory.create_message(b'{"msg":{"cmd":"scan"}}') is None
+    assert factory.create_message(b'{"other":{}}') is None
+    assert factory.create_message(b"\x00\x01binary") is None
+    assert factory.create_message(b'{"msg": truncated') is None
+    assert factory.create_message(b'["msg"]') is None
+    assert factory.create_message(b'"msg"') is None
+    assert factory.create_message(b'{"msg":"cmd data"}') is None
+    assert factory.create_message(b'{"msg":{"cmd":["x"],"data":{}}}') is None
+    assert factory.create_message(b'{"msg":{"cmd":"scan","data":"x"}}') is None
+
+
+def test_bytes_match_json():
+    messages = [
+        ScanMessage(),
+        StatusMessage(),
+        OnOffMessage(False),
+        BrightnessMessage(42),
+        ColorMessage(rgb=(64, 128, 255), temperature=None),
+        ColorMessage(rgb=None, temperature=5000),
+        BrightnessMessage(50.5),
+        ColorMessage(rgb=(64.7, 128.2, 255.0), temperature=None),
+        ColorMessage(rgb=None, temperature=4500.9),
+    ]
+    for msg in messages:
+        assert bytes(msg) == msg.as_json().encode("utf-8")
+
+
+def test_messages_have_no_instance_dict():
+    for msg in (ScanMessage(), OnOffMessage(True), ScanResponse({})):
+        assert not hasattr(msg, "__dict__")
+
+
+def test_generic_encoding_matches_json():
+    msg = StatusResponse({"onOff": 1, "brightness": 50})
+    assert bytes(msg) == msg.as_json().encode("utf-8")
+
+
+def test_non_int_values_are_coerced():
+    assert BrightnessMessage(50.5).data == {"value": 50}
+    assert bytes(BrightnessMessage(50.5)) == (
+        b'{"msg":{"cmd":"brightness","data":{"value":50}}}'
+    )